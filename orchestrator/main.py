@@ -1,5 +1,10 @@
 import os
+import io
 import sys
+import asyncio
+import logging
+import functools
+from collections import Counter
 from dotenv import load_dotenv
 
 # Load environment variables before importing modules that read them
@@ -25,9 +30,13 @@ from orchestrator.utils.logging import get_logger, ExecutionLogger
 # Initialize logger
 logger = get_logger("orchestrator.main")
 
+@functools.lru_cache(maxsize=1)
 def build_graph():
     """
     Constructs the Multi-Agent Orchestrator Graph.
+    
+    The compiled graph depends only on code, not on input, so it is built
+    once per process and shared by every run.
     """
     workflow = StateGraph(SharedState)
     
@@ -195,6 +204,10 @@ def build_graph():
     
     return workflow.compile()
 
+def get_app():
+    """Return the shared compiled graph, building it on first use."""
+    return build_graph()
+
 from langchain_core.messages import HumanMessage
 
 def validate_environment() -> bool:
@@ -236,10 +249,13 @@ def print_deployment_results(deployment_urls: Dict[str, str]):
     print("=" * 50)
 
 
-def run_orchestrator(user_input: str) -> dict:
+async def run_orchestrator(user_input: str) -> dict:
     """
     Run the orchestrator with the given input.
     
+    The graph is driven with ``app.astream`` so that parallel branches
+    (dispatcher -> workers) are scheduled concurrently on the event loop.
+    
     Args:
         user_input: The user's request
         
@@ -251,7 +267,7 @@ def run_orchestrator(user_input: str) -> dict:
     logger.info("Initializing Multi-Agent Orchestrator...")
     
     try:
-        app = build_graph()
+        app = get_app()
         logger.info("Graph compiled successfully.")
         
         logger.info(f"Processing request: {user_input}")
@@ -283,23 +299,33 @@ def run_orchestrator(user_input: str) -> dict:
         }
         
         total_usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
-        final_state = initial_state
+        # Only the aggregates needed for the summary are tracked; node updates
+        # carry partial task lists, so tasks are merged by id like merge_tasks
+        latest_tasks = {}
         all_deployment_urls = {}
         
         print("\n" + "=" * 50)
         print("EXECUTION START")
         print("=" * 50)
         
-        for event in app.stream(initial_state):
+        # Bind hot-loop lookups once
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        log_token_usage = exec_logger.log_token_usage
+        log_error = exec_logger.log_error
+        write_out = sys.stdout.write
+        flush_out = sys.stdout.flush
+        
+        async for event in app.astream(initial_state):
             for node_name, node_state in event.items():
-                print(f"\n--- Node: {node_name} ---")
-                logger.debug(f"Node completed: {node_name}")
+                # Collect all output for this event and emit it with a single write
+                buf = io.StringIO()
+                buf.write(f"\n--- Node: {node_name} ---\n")
+                if debug_enabled:
+                    logger.debug("Node completed: %s", node_name)
                 
-                # Update final state
                 if node_state is None:
-                    logger.warning(f"Node {node_name} returned None; skipping state update")
+                    logger.warning("Node %s returned None; skipping state update", node_name)
                     node_state = {}
-                final_state.update(node_state)
                 
                 # Track token usage
                 if "token_usage" in node_state:
@@ -307,55 +333,62 @@ def run_orchestrator(user_input: str) -> dict:
                     input_t = u.get('input_tokens', 0)
                     output_t = u.get('output_tokens', 0)
                     
-                    print(f"  Tokens: {input_t} in / {output_t} out")
+                    buf.write(f"  Tokens: {input_t} in / {output_t} out\n")
                     
                     total_usage["input_tokens"] += input_t
                     total_usage["output_tokens"] += output_t
                     total_usage["total_tokens"] += u.get("total_tokens", 0)
                     
-                    exec_logger.log_token_usage(node_name, input_t, output_t)
+                    log_token_usage(node_name, input_t, output_t)
 
                 # Print Task Updates
                 if "tasks_queue" in node_state:
-                    tasks = node_state['tasks_queue']
-                    pending = len([t for t in tasks if t['status'] == 'pending'])
-                    completed = len([t for t in tasks if t['status'] == 'completed'])
-                    failed = len([t for t in tasks if t['status'] == 'failed'])
-                    print(f"  Tasks: {completed} done, {pending} pending, {failed} failed")
+                    tasks = node_state['tasks_queue'] or []
+                    for t in tasks:
+                        latest_tasks[t['id']] = t
+                    status_counts = Counter(t['status'] for t in tasks)
+                    buf.write(
+                        f"  Tasks: {status_counts['completed']} done, "
+                        f"{status_counts['pending']} pending, {status_counts['failed']} failed\n"
+                    )
                 
                 # Collect deployment URLs
                 if "deployment_urls" in node_state and node_state["deployment_urls"]:
                     all_deployment_urls.update(node_state["deployment_urls"])
-                    print(f"  Deployment URL collected: {node_state['deployment_urls']}")
+                    buf.write(f"  Deployment URL collected: {node_state['deployment_urls']}\n")
                 
                 # Print errors if any
                 if "error_logs" in node_state and node_state["error_logs"]:
                     for err in node_state["error_logs"]:
                         error_msg = err.get('error', 'Unknown error')
                         task_id = err.get('task_id', 'N/A')
-                        print(f"  ERROR [{task_id}]: {error_msg}")
-                        exec_logger.log_error(node_name, error_msg, task_id)
+                        buf.write(f"  ERROR [{task_id}]: {error_msg}\n")
+                        log_error(node_name, error_msg, task_id)
+                
+                write_out(buf.getvalue())
+                flush_out()
         
         print("\n" + "=" * 50)
         print("EXECUTION COMPLETE")
         print("=" * 50)
         
         # Final summary
-        final_tasks = final_state.get('tasks_queue', [])
-        completed_tasks = [t for t in final_tasks if t['status'] == 'completed']
-        failed_tasks = [t for t in final_tasks if t['status'] == 'failed']
+        final_tasks = list(latest_tasks.values())
+        status_counts = Counter(t['status'] for t in final_tasks)
+        completed_count = status_counts['completed']
+        failed_count = status_counts['failed']
         
         print(f"\nResults:")
         print(f"  Total tasks: {len(final_tasks)}")
-        print(f"  Completed: {len(completed_tasks)}")
-        print(f"  Failed: {len(failed_tasks)}")
+        print(f"  Completed: {completed_count}")
+        print(f"  Failed: {failed_count}")
         print(f"\nToken Usage:")
         print(f"  Input: {total_usage['input_tokens']}")
         print(f"  Output: {total_usage['output_tokens']}")
         print(f"  Total: {total_usage['total_tokens']}")
         
         # Print deployment results
-        final_deployment_urls = all_deployment_urls or final_state.get('deployment_urls', {})
+        final_deployment_urls = all_deployment_urls
         print_deployment_results(final_deployment_urls)
         
         # Log summary
@@ -363,9 +396,9 @@ def run_orchestrator(user_input: str) -> dict:
         logger.info(f"Execution summary: {summary}")
         
         return {
-            "success": len(failed_tasks) == 0,
-            "tasks_completed": len(completed_tasks),
-            "tasks_failed": len(failed_tasks),
+            "success": failed_count == 0,
+            "tasks_completed": completed_count,
+            "tasks_failed": failed_count,
             "token_usage": total_usage,
             "deployment_urls": final_deployment_urls,
             "log_file": exec_logger.log_file
@@ -396,7 +429,7 @@ if __name__ == "__main__":
         sys.exit(0)
     
     # Run orchestrator
-    result = run_orchestrator(user_input)
+    result = asyncio.run(run_orchestrator(user_input))
     
     print(f"\nLog file: {result.get('log_file', 'N/A')}")
     
@@ -2,13 +2,17 @@
 Answer Parser Node - parses user answers from messages and updates questions.md.
 """
 
+import io
 import os
-import time
-import json
+import asyncio
 import re
+import difflib
 from typing import Optional, Any, Dict
+import orjson
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
+from orchestrator.utils.messages import get_last_user_message, RECOVERABLE_API_ERRORS
+from orchestrator.utils.json_scan import JsonObjectScanner
 from orchestrator.state import (
     SharedState, 
     answer_question, 
@@ -25,8 +29,43 @@ from orchestrator.tools.spec_feature_tools import (
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+# Local answer matching: accept the best question when it scores at least
+# FUZZY_MATCH_THRESHOLD and beats the runner-up by FUZZY_MATCH_MARGIN points
+FUZZY_MATCH_THRESHOLD = 80
+FUZZY_MATCH_MARGIN = 15
+# ...and only when answer and question share at least this many content
+# words; token-set scoring gives short answers ("yes", "React") full marks
+FUZZY_MATCH_MIN_SHARED_TOKENS = 3
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "is", "are",
+    "be", "it", "this", "that", "yes", "no", "i", "we", "you", "one", "first", "second",
+    "do", "should", "will", "what", "which", "how", "use",
+})
+
+# Patterns like "#1", "question 1", "q1", "question1"
+_Q_NUM_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'#(\d+)',
+        r'question\s*(\d+)',
+        r'q\s*(\d+)',
+        r'question(\d+)',
+    )
+]
+_ANSWER_EXTRACT_RE = re.compile(r'(?:#|question|q)\s*\d+\s*[:\.]?\s*(.+)', re.IGNORECASE | re.DOTALL)
+_WORD_RE = re.compile(r'\w+')
+
+# questions.md structure: one block per "## Question N:" header
+_Q_BLOCK_RE = re.compile(r'(?msi)^##\s+Question\s+(\d+):.*?(?=^##\s+Question\s|\Z)')
+_ANSWER_LINE_RE = re.compile(r'(?mi)^-\s*\*\*Answer\*\*:.*$')
+_STATUS_LINE_RE = re.compile(r'(?mi)^-\s*\*\*Status\*\*:.*$')
+
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -34,56 +73,109 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
-
-def _get_last_user_message(messages) -> str:
-    """Return the most recent user message content."""
-    for msg in reversed(messages or []):
-        if hasattr(msg, "type") and getattr(msg, "type") == "human":
-            return str(getattr(msg, "content", ""))
-        if isinstance(msg, dict) and msg.get("role") == "user":
-            return str(msg.get("content", ""))
-    if messages:
-        last = messages[-1]
-        return str(getattr(last, "content", last))
-    return ""
+def _parse_json_text(response_text: str) -> Dict[str, Any]:
+    """Parse the JSON in a full response, unwrapping a ``` fence if present."""
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0]
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0]
+    return orjson.loads(response_text)
+
+def _call_api_stream_json(model, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Streams the response and parses the first complete JSON object as soon as
+    its closing brace arrives, without waiting for the rest of the output.
+    
+    A transient error while the stream is being read falls back to a
+    non-streaming call, which has its own retries.
+    """
+    response = call_with_retry(model.generate_content, prompt, stream=True, max_retries=max_retries)
+    buf = io.StringIO()
+    scanner = JsonObjectScanner()
+
+    try:
+        for chunk in response:
+            text = chunk.text
+            buf.write(text)
+            if scanner.feed(text) is not None:
+                return orjson.loads(buf.getvalue()[scanner.start:scanner.end])
+    except RECOVERABLE_API_ERRORS as e:
+        print(f"Stream interrupted ({type(e).__name__}), retrying without streaming...")
+        return _parse_json_text(call_with_retry(model.generate_content, prompt, max_retries=max_retries).text)
+
+    # Stream ended without a balanced object; parse whatever came back
+    return _parse_json_text(buf.getvalue())
 
 def _parse_question_number(user_msg: str) -> Optional[int]:
     """Try to extract question number from user message."""
-    # Look for patterns like "#1", "question 1", "q1", "question1"
-    patterns = [
-        r'#(\d+)',
-        r'question\s*(\d+)',
-        r'q\s*(\d+)',
-        r'question(\d+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, user_msg, re.IGNORECASE)
+    for pattern in _Q_NUM_PATTERNS:
+        match = pattern.search(user_msg)
         if match:
             return int(match.group(1))
     
     return None
 
+def _token_set_ratio(a: str, b: str) -> float:
+    """
+    Token-set similarity (0-100) between two strings.
+
+    Compares the shared words against each side's full word set, so an
+    answer that repeats the question's wording scores high regardless of
+    extra words or word order.
+    """
+    tokens_a = set(_WORD_RE.findall(a.lower()))
+    tokens_b = set(_WORD_RE.findall(b.lower()))
+    if not tokens_a or not tokens_b:
+        return 0.0
+
+    common = " ".join(sorted(tokens_a & tokens_b))
+    combined_a = " ".join(filter(None, [common, " ".join(sorted(tokens_a - tokens_b))]))
+    combined_b = " ".join(filter(None, [common, " ".join(sorted(tokens_b - tokens_a))]))
+
+    candidates = [(combined_a, combined_b)]
+    if common:
+        candidates += [(common, combined_a), (common, combined_b)]
+    return max(difflib.SequenceMatcher(None, x, y).ratio() for x, y in candidates) * 100
+
+
+def _shared_content_tokens(a: str, b: str) -> int:
+    """Number of distinct non-stopword words that occur in both strings."""
+    shared = set(_WORD_RE.findall(a.lower())) & set(_WORD_RE.findall(b.lower()))
+    return len(shared - _STOPWORDS)
+
+
+def _match_answer_to_question_locally(user_msg: str, questions: list) -> Optional[Dict[str, Any]]:
+    """
+    Match user answer to an open question by text similarity, without an API call.
+
+    Returns None when no question scores high enough or the top two are too
+    close to call, so the caller can escalate to the LLM matcher.
+    """
+    open_questions_list = [q for q in questions if q.get("status") == "open"]
+    if not open_questions_list:
+        return None
+
+    scores = sorted(
+        ((_token_set_ratio(user_msg, q.get("question", "")), q) for q in open_questions_list),
+        key=lambda item: item[0],
+        reverse=True,
+    )
+    best_score, best_question = scores[0]
+    if best_score < FUZZY_MATCH_THRESHOLD:
+        return None
+    if _shared_content_tokens(user_msg, best_question.get("question", "")) < FUZZY_MATCH_MIN_SHARED_TOKENS:
+        return None
+    if len(scores) > 1 and best_score - scores[1][0] < FUZZY_MATCH_MARGIN:
+        return None
+
+    return {
+        "question_id": best_question.get("id"),
+        "answer": user_msg
+    }
+
 def _match_answer_to_question_with_llm(user_msg: str, questions: list) -> Optional[Dict[str, Any]]:
     """Use LLM to match user answer to the correct question."""
     _ensure_api_configured()
@@ -126,20 +218,11 @@ Output JSON format:
 If the answer doesn't match any question, return {{"question_numbers": [], "answer_text": ""}}.
 """
     
+    # One-shot prompt: no chat session needed
     model = genai.GenerativeModel(model_name=MODEL_NAME)
-    chat = model.start_chat()
     
     try:
-        response = _call_api_with_retry(chat, prompt)
-        response_text = response.text
-        
-        # Extract JSON from response
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
-        
-        result = json.loads(response_text.strip())
+        result = _call_api_stream_json(model, prompt)
         question_numbers = result.get("question_numbers", [])
         answer_text = result.get("answer_text", user_msg)
         
@@ -161,9 +244,32 @@ If the answer doesn't match any question, return {{"question_numbers": [], "answ
     
     return None
 
-def answer_parser_node(state: SharedState) -> SharedState:
+def _apply_answers_to_questions_md(questions_content: str, answers_by_num: Dict[int, str]) -> str:
+    """Rewrite Answer/Status lines of the answered "## Question N:" blocks."""
+    def replacer(m):
+        block = m.group(0)
+        answer = answers_by_num.get(int(m.group(1)))
+        if answer:
+            block = _ANSWER_LINE_RE.sub(lambda _: f"- **Answer**: {answer}", block)
+            block = _STATUS_LINE_RE.sub("- **Status**: answered", block)
+        return block
+
+    return _Q_BLOCK_RE.sub(replacer, questions_content)
+
+def _answers_recorded_result(open_questions: list, answered_count: int) -> Dict[str, Any]:
+    """Build the state update returned after recording answers."""
+    still_open = sum(1 for q in open_questions if q.get('status') == 'open')
+    return {
+        "open_questions": open_questions,
+        "messages": [f"Answer Parser: Recorded {answered_count} answer(s). {still_open} question(s) still open."]
+    }
+
+async def answer_parser_node(state: SharedState) -> SharedState:
     """
     Answer Parser Node - parses user answers and updates questions.md.
+    
+    Runs on the graph's event loop; file I/O and the LLM matcher are
+    offloaded to worker threads so they don't block other branches.
     """
     feature_name = state.get('feature_name')
     spec_path = state.get('spec_path', 'spec/')
@@ -179,7 +285,7 @@ def answer_parser_node(state: SharedState) -> SharedState:
     print(f"[Answer Parser] Parsing answers for feature: {feature_name} (phase: {current_phase})")
     
     # Get user message
-    user_msg = _get_last_user_message(state.get('messages', []))
+    user_msg = get_last_user_message(state.get('messages', []))
     if not user_msg:
         return handle_error_with_retry_budget(
             state,
@@ -188,63 +294,57 @@ def answer_parser_node(state: SharedState) -> SharedState:
             context={"feature_name": feature_name}
         )
     
-    # Get open questions from state
-    open_questions = state.get('open_questions', []).copy()
-    
-    # Read existing questions.md
-    questions_content = read_spec_file(feature_name, 'questions', spec_path)
-    
+    # Get open questions from state (answers are recorded on the items in place;
+    # the open_questions reducer merges them back by id)
+    open_questions = state.get('open_questions', [])
     if not open_questions:
         print("[Answer Parser] No open questions found")
         return {}
     
-    # Parse answers
-    answered_count = 0
-    question_id_answer_map = {}
+    # Read existing questions.md
+    questions_content = await asyncio.to_thread(read_spec_file, feature_name, 'questions', spec_path)
     
     # Try to extract question number first
     question_num = _parse_question_number(user_msg)
     
     if question_num and question_num <= len(open_questions):
-        # Direct question number match
-        open_questions_list = [q for q in open_questions if q.get("status") == "open"]
-        if question_num <= len(open_questions_list):
-            question_to_answer = open_questions_list[question_num - 1]
-            question_id = question_to_answer.get("id")
-            # Extract answer text (everything after the question reference)
-            answer_text = user_msg
-            # Try to extract answer after question number
-            match = re.search(r'(?:#|question|q)\s*\d+\s*[:\.]?\s*(.+)', user_msg, re.IGNORECASE | re.DOTALL)
-            if match:
-                answer_text = match.group(1).strip()
-            
-            question_id_answer_map[question_id] = answer_text
-            answered_count = 1
+        # Direct question number match: questions.md numbers questions in open_questions order
+        question_id = open_questions[question_num - 1].get("id")
+        # Extract answer text (everything after the question reference)
+        match = _ANSWER_EXTRACT_RE.search(user_msg)
+        answer_text = match.group(1).strip() if match else user_msg
+        
+        answer_question(open_questions, question_id, answer_text)
+        
+        if questions_content:
+            updated_content = _apply_answers_to_questions_md(questions_content, {question_num: answer_text})
+            await asyncio.to_thread(write_spec_file, feature_name, "questions", updated_content, spec_path)
+            print(f"[Answer Parser] Updated questions.md with 1 answer(s)")
+        
+        return _answers_recorded_result(open_questions, 1)
+    
+    # Parse answers
+    answered_count = 0
+    question_id_answer_map = {}
+    
+    # Try a local similarity match first, escalate to LLM if ambiguous
+    match_result = _match_answer_to_question_locally(user_msg, open_questions)
+    if not match_result:
+        match_result = await asyncio.to_thread(_match_answer_to_question_with_llm, user_msg, open_questions)
+    if match_result:
+        question_id = match_result.get("question_id")
+        answer_text = match_result.get("answer", user_msg)
+        question_id_answer_map[question_id] = answer_text
+        answered_count = 1
     else:
-        # Use LLM to match answer to question
-        match_result = _match_answer_to_question_with_llm(user_msg, open_questions)
-        if match_result:
-            question_id = match_result.get("question_id")
-            answer_text = match_result.get("answer", user_msg)
-            question_id_answer_map[question_id] = answer_text
+        # If LLM matching failed and no explicit question number, try to match to all open questions
+        # This handles cases where user provides a general answer that might apply to multiple questions
+        open_questions_list = [q for q in open_questions if q.get("status") == "open"]
+        if len(open_questions_list) == 1:
+            # If only one open question, assume answer is for it
+            question_id = open_questions_list[0].get("id")
+            question_id_answer_map[question_id] = user_msg
             answered_count = 1
-        else:
-            # If LLM matching failed and no explicit question number, try to match to all open questions
-            # This handles cases where user provides a general answer that might apply to multiple questions
-            open_questions_list = [q for q in open_questions if q.get("status") == "open"]
-            if len(open_questions_list) == 1:
-                # If only one open question, assume answer is for it
-                question_id = open_questions_list[0].get("id")
-                question_id_answer_map[question_id] = user_msg
-                answered_count = 1
-    
-    # Update open_questions in state
-    updated_questions = []
-    for q in open_questions:
-        question_id = q.get("id")
-        if question_id in question_id_answer_map:
-            answer_question(open_questions, question_id, question_id_answer_map[question_id])
-            updated_questions.append(q)
     
     if answered_count == 0:
         print("[Answer Parser] Could not match answer to any question")
@@ -257,77 +357,21 @@ def answer_parser_node(state: SharedState) -> SharedState:
         error_result["messages"] = ["Answer Parser: Could not match your answer to any question. Please specify question number (e.g., '#1: answer')"]
         return error_result
     
+    # Update open_questions in state; questions.md numbers them in the same order
+    answers_by_num = {}
+    for num, q in enumerate(open_questions, 1):
+        question_id = q.get("id")
+        if question_id in question_id_answer_map:
+            answer_question(open_questions, question_id, question_id_answer_map[question_id])
+            answers_by_num[num] = q.get("answer", "")
+    
     # Update questions.md file
-    if questions_content and updated_questions:
-        # Parse questions.md and update answers
-        lines = questions_content.split('\n')
-        updated_lines = []
-        current_question_num = 0
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # Check if this is a question header
-            if re.match(r'^##\s+Question\s+(\d+):', line, re.IGNORECASE):
-                current_question_num += 1
-                # Find the corresponding question in updated_questions
-                question_to_update = None
-                for q in updated_questions:
-                    # Try to match by index (simplified - assumes order matches)
-                    # In a more robust implementation, we'd use question IDs stored in the file
-                    pass
-                
-                updated_lines.append(line)
-                i += 1
-                
-                # Look for Answer line in this question section
-                in_question_section = True
-                while i < len(lines) and in_question_section:
-                    line = lines[i]
-                    
-                    # Check if we've reached the next question section
-                    if re.match(r'^##\s+Question\s+', line, re.IGNORECASE):
-                        in_question_section = False
-                        break
-                    
-                    # Update Answer line if found
-                    if re.match(r'^-\s*\*\*Answer\*\*:', line, re.IGNORECASE):
-                        # Find answer for this question number
-                        answer_for_this = None
-                        for q_idx, q in enumerate(updated_questions, 1):
-                            if current_question_num == q_idx:
-                                answer_for_this = q.get("answer", "")
-                                break
-                        
-                        if answer_for_this:
-                            updated_lines.append(f"- **Answer**: {answer_for_this}")
-                            # Skip the old answer line
-                            i += 1
-                            continue
-                    
-                    # Update Status line if found
-                    if re.match(r'^-\s*\*\*Status\*\*:', line, re.IGNORECASE):
-                        updated_lines.append("- **Status**: answered")
-                        i += 1
-                        continue
-                    
-                    updated_lines.append(line)
-                    i += 1
-                
-                continue
-            
-            updated_lines.append(line)
-            i += 1
-        
-        updated_content = '\n'.join(updated_lines)
-        write_spec_file(feature_name, "questions", updated_content, spec_path)
+    if questions_content and answers_by_num:
+        updated_content = _apply_answers_to_questions_md(questions_content, answers_by_num)
+        await asyncio.to_thread(write_spec_file, feature_name, "questions", updated_content, spec_path)
         print(f"[Answer Parser] Updated questions.md with {answered_count} answer(s)")
     
-    return {
-        "open_questions": open_questions,
-        "messages": [f"Answer Parser: Recorded {answered_count} answer(s). {len([q for q in open_questions if q.get('status') == 'open'])} question(s) still open."]
-    }
+    return _answers_recorded_result(open_questions, answered_count)
 
 def answer_parser_router(state: SharedState) -> str:
     """
@@ -1,34 +1,59 @@
 import os
-from typing import List
+import functools
+from typing import Dict, List
 
 from orchestrator.state import SharedState, Task
 
-# Parallelism control
-MAX_PARALLEL_TASKS = int(os.getenv("MAX_PARALLEL_TASKS", "2"))
+# Parallelism control (one slot per worker role by default)
+DEFAULT_MAX_PARALLEL_TASKS = "4"
 
 # Priority order for roles (deploy_agent is last to ensure all files are ready)
-ROLE_PRIORITY = ['db_agent', 'logic_agent', 'ui_agent', 'deploy_agent']
+ROLE_PRIORITY = ('db_agent', 'logic_agent', 'ui_agent', 'deploy_agent')
 
 
-def _get_ready_tasks(tasks: List[Task]) -> List[Task]:
-    completed_ids = {t['id'] for t in tasks if t['status'] == 'completed'}
-    failed_ids = {t['id'] for t in tasks if t['status'] == 'failed'}
-    ready_tasks = []
+@functools.cache
+def _max_parallel() -> int:
+    """
+    Maximum number of tasks running at once (MAX_PARALLEL_TASKS env var).
+
+    This bounds how many worker branches the graph fans out to concurrently.
+    Read on first use; call _max_parallel.cache_clear() after changing the env.
+    """
+    return int(os.getenv("MAX_PARALLEL_TASKS", DEFAULT_MAX_PARALLEL_TASKS))
+
+
+def _get_ready_tasks(tasks: List[Task]) -> Dict[str, List[Task]]:
+    """
+    Returns pending tasks whose dependencies are all completed, grouped by role.
+    Buckets (and the roles themselves) keep the order of the tasks queue.
+    """
+    completed_ids = set()
+    failed_ids = set()
+    pending_tasks = []
 
     for t in tasks:
-        if t['status'] != 'pending':
+        status = t['status']
+        if status == 'completed':
+            completed_ids.add(t['id'])
+        elif status == 'failed':
+            failed_ids.add(t['id'])
+        elif status == 'pending':
+            pending_tasks.append(t)
+
+    ready_by_role: Dict[str, List[Task]] = {}
+    for t in pending_tasks:
+        deps = t['dependencies']
+        if not failed_ids.isdisjoint(deps):
             continue
-        if any(d in failed_ids for d in t['dependencies']):
-            continue
-        if all(d in completed_ids for d in t['dependencies']):
-            ready_tasks.append(t)
+        if completed_ids.issuperset(deps):
+            ready_by_role.setdefault(t['assigned_role'], []).append(t)
 
-    return ready_tasks
+    return ready_by_role
 
 
 def dispatcher_node(state: SharedState) -> SharedState:
     """
-    Selects up to MAX_PARALLEL_TASKS ready tasks and marks them as running.
+    Selects up to _max_parallel() ready tasks and marks them as running.
     Ensures only one task per role is running at a time.
     """
     tasks = state.get('tasks_queue', [])
@@ -37,13 +62,13 @@ def dispatcher_node(state: SharedState) -> SharedState:
 
     running_tasks = [t for t in tasks if t['status'] == 'running']
     running_roles = {t['assigned_role'] for t in running_tasks}
-    available_slots = MAX_PARALLEL_TASKS - len(running_tasks)
+    available_slots = _max_parallel() - len(running_tasks)
 
     if available_slots <= 0:
         return {}
 
-    ready_tasks = _get_ready_tasks(tasks)
-    if not ready_tasks:
+    ready_by_role = _get_ready_tasks(tasks)
+    if not ready_by_role:
         return {}
 
     selected_updates: List[Task] = []
@@ -53,23 +78,21 @@ def dispatcher_node(state: SharedState) -> SharedState:
     for role in ROLE_PRIORITY:
         if available_slots <= 0:
             break
-        for t in ready_tasks:
-            if t['assigned_role'] == role and t['assigned_role'] not in used_roles:
-                selected_updates.append({**t, "status": "running"})
-                used_roles.add(t['assigned_role'])
-                available_slots -= 1
-                break
+        role_tasks = ready_by_role.get(role)
+        if role_tasks and role not in used_roles:
+            selected_updates.append(dict(role_tasks[0], status="running"))
+            used_roles.add(role)
+            available_slots -= 1
 
     # Fill remaining slots with any other roles
-    if available_slots > 0:
-        for t in ready_tasks:
-            if available_slots <= 0:
-                break
-            if t['assigned_role'] in used_roles:
-                continue
-            selected_updates.append({**t, "status": "running"})
-            used_roles.add(t['assigned_role'])
-            available_slots -= 1
+    for role, role_tasks in ready_by_role.items():
+        if available_slots <= 0:
+            break
+        if role in used_roles:
+            continue
+        selected_updates.append(dict(role_tasks[0], status="running"))
+        used_roles.add(role)
+        available_slots -= 1
 
     if not selected_updates:
         return {}
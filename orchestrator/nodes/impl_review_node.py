@@ -1,9 +1,12 @@
 import os
+import re
 import json
-import time
-from typing import List, Dict, Any, Optional, Tuple
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
 from orchestrator.state import (
     SharedState, 
     Task, 
@@ -14,17 +17,26 @@ from orchestrator.state import (
     handle_error_with_retry_budget
 )
 from orchestrator.tools.fs_tools import read_file, WORKSPACE_DIR
-from orchestrator.tools.spec_feature_tools import (
-    read_spec_file,
-    read_all_constitution_files,
-)
+from orchestrator.tools.spec_feature_tools import read_spec_file
+from orchestrator.tools._cache import cached_constitution
 from orchestrator.nodes.worker_node import get_current_task_id
 
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+# Review JSON in the response: a ```json block, else any ``` block, else the
+# outermost {...}; an unclosed fence runs to the end of the text
+_JSON_FENCE_RE = re.compile(r'```json(.*?)(?:```|\Z)', re.DOTALL)
+_FENCE_RE = re.compile(r'```(.*?)(?:```|\Z)', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -32,6 +44,7 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
 # Configure on module load
@@ -40,24 +53,15 @@ try:
 except ValueError as e:
     print(f"Warning: {e}")
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
+_MODEL: Optional[genai.GenerativeModel] = None
+
+def _get_model() -> genai.GenerativeModel:
+    """Returns the shared GenerativeModel, creating it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        _ensure_api_configured()
+        _MODEL = genai.GenerativeModel(model_name=MODEL_NAME)
+    return _MODEL
 
 def _get_changed_files(state: SharedState) -> List[str]:
     """Get list of files that were potentially changed, excluding artifacts/logs."""
@@ -71,22 +75,31 @@ def _get_changed_files(state: SharedState) -> List[str]:
         changed.append(path)
     return changed
 
+def _read_file_head(filepath: str, max_size: int) -> str:
+    """One section of the review context: the file's first max_size characters."""
+    try:
+        full_path = os.path.join(WORKSPACE_DIR, filepath.lstrip('/'))
+        if not os.path.isfile(full_path):
+            return ""
+        with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+            # One character past the limit tells us whether to truncate,
+            # without reading the rest of a large file
+            content = f.read(max_size + 1)
+        if len(content) > max_size:
+            content = content[:max_size] + "\n... (truncated)"
+        return f"=== {filepath} ===\n{content}\n"
+    except Exception as e:
+        return f"=== {filepath} ===\nError reading file: {e}\n"
+
 def _get_file_contents(filepaths: List[str], max_size: int = 5000) -> str:
     """Read contents of changed files for analysis."""
-    contents = []
-    for filepath in filepaths[:10]:  # Limit to 10 files to avoid token overflow
-        try:
-            full_path = os.path.join(WORKSPACE_DIR, filepath.lstrip('/'))
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    # Truncate if too large
-                    if len(content) > max_size:
-                        content = content[:max_size] + "\n... (truncated)"
-                    contents.append(f"=== {filepath} ===\n{content}\n")
-        except Exception as e:
-            contents.append(f"=== {filepath} ===\nError reading file: {e}\n")
-    return "\n".join(contents)
+    selected = filepaths[:10]  # Limit to 10 files to avoid token overflow
+    if not selected:
+        return ""
+    # Reads are I/O bound and independent; map keeps the original file order
+    with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+        sections = pool.map(lambda path: _read_file_head(path, max_size), selected)
+        return "\n".join(section for section in sections if section)
 
 def _create_corrective_tasks(original_task: Task, issues: List[str], role: str) -> List[Task]:
     """Create corrective tasks based on review issues."""
@@ -117,32 +130,42 @@ def impl_review_node(state: SharedState, role: str) -> SharedState:
     # Get the task ID from worker
     current_task_id = get_current_task_id(role)
     
-    # Find the task that was just worked on
-    target_task = None
-    completed_ids = {t['id'] for t in tasks if t['status'] == 'completed'}
-    running_tasks = [t for t in tasks if t['status'] == 'running'] if tasks else []
-
-    # First try to find running task by current_task_id
+    # Find the task that was just worked on (target_idx is its queue position)
+    target_idx = None
+    
+    # First try to find running task by current_task_id; stops at the match
     if current_task_id:
-        for t in tasks:
-            if t['id'] == current_task_id and t['status'] == 'running':
-                target_task = t
-                break
+        target_idx = next(
+            (i for i, t in enumerate(tasks) if t['id'] == current_task_id and t['status'] == 'running'),
+            None
+        )
     
-    # Fallback: find running task for this role
-    if not target_task and running_tasks:
-        for t in tasks:
-            if t['assigned_role'] == role and t['status'] == 'running':
-                target_task = t
-                break
+    if target_idx is None:
+        # The fallbacks need completed ids and running/pending tasks per role
+        # (in queue order); index the queue in one pass, only on this path
+        completed_ids = set()
+        first_running_by_role: Dict[str, int] = {}
+        pending_by_role: Dict[str, List[int]] = defaultdict(list)
+        for i, t in enumerate(tasks):
+            if t['status'] == 'completed':
+                completed_ids.add(t['id'])
+            elif t['status'] == 'running':
+                first_running_by_role.setdefault(t['assigned_role'], i)
+            elif t['status'] == 'pending':
+                pending_by_role[t['assigned_role']].append(i)
+        
+        if first_running_by_role:
+            # Fallback: find running task for this role
+            target_idx = first_running_by_role.get(role)
+        else:
+            # Final fallback: find pending task for this role (sequential mode)
+            target_idx = next(
+                (i for i in pending_by_role.get(role, ())
+                 if all(d in completed_ids for d in tasks[i]['dependencies'])),
+                None
+            )
     
-    # Final fallback: find pending task for this role (sequential mode)
-    if not target_task and not running_tasks:
-        for t in tasks:
-            if t['assigned_role'] == role and t['status'] == 'pending':
-                if all(d in completed_ids for d in t['dependencies']):
-                    target_task = t
-                    break
+    target_task = tasks[target_idx] if target_idx is not None else None
     
     if not target_task:
         return {}
@@ -197,7 +220,8 @@ def impl_review_node(state: SharedState, role: str) -> SharedState:
     if feature_name:
         try:
             plan_content = read_spec_file(feature_name, 'plan', spec_path)
-            constitution_content = read_all_constitution_files(spec_path)
+            # Memoized until a constitution file changes
+            constitution_content = cached_constitution(spec_path)
         except Exception as e:
             print(f"Warning: Could not read spec files: {e}")
     
@@ -251,21 +275,22 @@ If status is "pass", proceed to runtime validation.
 If status is "issues", provide specific actionable issues that need to be fixed.
 """
     
-    # Create model and chat
-    model = genai.GenerativeModel(model_name=MODEL_NAME)
-    chat = model.start_chat()
-    
     try:
-        response = _call_api_with_retry(chat, prompt)
+        # One-shot prompt on the shared model: no chat session needed
+        response = call_with_retry(_get_model().generate_content, prompt)
         response_text = response.text
         
         # Extract JSON from response
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
+        match = (
+            _JSON_FENCE_RE.search(response_text)
+            or _FENCE_RE.search(response_text)
+            or _JSON_OBJECT_RE.search(response_text)
+        )
+        if match:
+            response_text = match.group(match.lastindex or 0)
         
-        review_result = json.loads(response_text.strip())
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, handled below
+        review_result = orjson.loads(response_text.strip())
         
         status = review_result.get("status", "issues")
         issues = review_result.get("issues", [])
@@ -312,11 +337,9 @@ If status is "issues", provide specific actionable issues that need to be fixed.
             target_task['status'] = 'completed'
             target_task['feedback'] = f"Impl review found {len(issues)} issue(s): {summary[:200]}"
             
-            # Update original task in queue
-            for idx, t in enumerate(existing_tasks):
-                if t['id'] == target_task['id']:
-                    existing_tasks[idx] = target_task
-                    break
+            # Update original task in queue (existing_tasks is a copy of tasks,
+            # so its position is unchanged)
+            existing_tasks[target_idx] = target_task
             
             print(f"[Impl Review:{role}] Created {len(corrective_tasks)} corrective task(s). Returning to EXECUTING.")
             
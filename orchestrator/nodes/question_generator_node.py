@@ -3,11 +3,10 @@ Question Generator Node - generates blocking questions and creates questions.md
 """
 
 import os
-import time
 import json
-from typing import Optional, Any, Dict
+from typing import Optional, Dict
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
 from orchestrator.state import (
     SharedState, 
     add_open_question,
@@ -25,8 +24,13 @@ from orchestrator.tools.spec_feature_tools import (
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -34,26 +38,18 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
+_MODEL: Optional[genai.GenerativeModel] = None
+
+def _get_model() -> genai.GenerativeModel:
+    """Returns the shared GenerativeModel, creating it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        _ensure_api_configured()
+        _MODEL = genai.GenerativeModel(model_name=MODEL_NAME)
+    return _MODEL
 
 def question_generator_node(state: SharedState) -> SharedState:
     """
@@ -138,12 +134,9 @@ Output JSON format:
 Focus on blocking questions only - information that MUST be known before proceeding with spec/plan/tasks.
 """
 
-    # Create model and chat
-    model = genai.GenerativeModel(model_name=MODEL_NAME)
-    chat = model.start_chat()
-    
     try:
-        response = _call_api_with_retry(chat, prompt)
+        # One-shot prompt: no chat session needed
+        response = call_with_retry(_get_model().generate_content, prompt)
         response_text = response.text
         
         # Extract JSON from response
@@ -159,12 +152,12 @@ Focus on blocking questions only - information that MUST be known before proceed
         
         print(f"[Question Generator] Generated {len(questions_data)} questions")
         
-        # Generate questions.md content
-        questions_md_content = f"# Questions — {feature_name}\n\n"
+        # Generate questions.md content (collected as parts, joined once)
+        md_parts = [f"# Questions — {feature_name}\n\n"]
         if summary:
-            questions_md_content += f"**Summary:** {summary}\n\n"
+            md_parts.append(f"**Summary:** {summary}\n\n")
         
-        questions_md_content += "## Questions\n\n"
+        md_parts.append("## Questions\n\n")
         
         # Process each question
         for i, q_data in enumerate(questions_data, 1):
@@ -176,17 +169,20 @@ Focus on blocking questions only - information that MUST be known before proceed
             question_id = add_open_question(open_questions, question_text, options)
             
             # Format for questions.md
-            questions_md_content += f"## Question {i}: {question_text}\n\n"
-            questions_md_content += f"- **Dependencies**: {dependencies}\n"
-            
-            if options and len(options) > 0:
-                options_str = ", ".join([f'"{opt}"' for opt in options])
-                questions_md_content += f"- **Options**: {options_str}\n"
+            if options:
+                options_str = ", ".join(f'"{opt}"' for opt in options)
             else:
-                questions_md_content += "- **Options**: (open-ended)\n"
+                options_str = "(open-ended)"
             
-            questions_md_content += "- **Status**: open\n"
-            questions_md_content += "- **Answer**: (pending)\n\n"
+            md_parts.append(
+                f"## Question {i}: {question_text}\n\n"
+                f"- **Dependencies**: {dependencies}\n"
+                f"- **Options**: {options_str}\n"
+                "- **Status**: open\n"
+                "- **Answer**: (pending)\n\n"
+            )
+        
+        questions_md_content = "".join(md_parts)
         
         # Write questions.md file
         write_spec_file(feature_name, "questions", questions_md_content, spec_path)
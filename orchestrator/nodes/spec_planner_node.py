@@ -3,11 +3,11 @@ Specification Planner Node - creates specifications following spec/feature.md in
 """
 
 import os
-import time
 import json
 from typing import Optional, Any, Dict
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
+from orchestrator.utils.messages import get_last_user_message
 from orchestrator.state import (
     SharedState, 
     add_open_question, 
@@ -30,8 +30,13 @@ from orchestrator.tools.spec_feature_tools import (
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -39,38 +44,18 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
+_MODEL: Optional[genai.GenerativeModel] = None
 
-def _get_last_user_message(messages) -> str:
-    """Return the most recent user message content."""
-    for msg in reversed(messages or []):
-        if hasattr(msg, "type") and getattr(msg, "type") == "human":
-            return str(getattr(msg, "content", ""))
-        if isinstance(msg, dict) and msg.get("role") == "user":
-            return str(msg.get("content", ""))
-    if messages:
-        last = messages[-1]
-        return str(getattr(last, "content", last))
-    return ""
+def _get_model() -> genai.GenerativeModel:
+    """Returns the shared GenerativeModel, creating it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        _ensure_api_configured()
+        _MODEL = genai.GenerativeModel(model_name=MODEL_NAME)
+    return _MODEL
 
 def spec_planner_node(state: SharedState) -> SharedState:
     """
@@ -92,7 +77,7 @@ def spec_planner_node(state: SharedState) -> SharedState:
         return error_result
     
     # Get user message
-    user_msg = _get_last_user_message(state.get('messages', []))
+    user_msg = get_last_user_message(state.get('messages', []))
     if not user_msg:
         error_result = handle_error_with_retry_budget(
             state,
@@ -229,12 +214,9 @@ If clarifications are needed, set clarifications to the content and set spec/pla
 Otherwise, set clarifications to null and provide all three files.
 """
     
-    # Create model and chat
-    model = genai.GenerativeModel(model_name=MODEL_NAME)
-    chat = model.start_chat()
-    
     try:
-        response = _call_api_with_retry(chat, prompt)
+        # One-shot prompt: no chat session needed
+        response = call_with_retry(_get_model().generate_content, prompt)
         response_text = response.text if hasattr(response, 'text') else str(response)
         
         # Extract JSON from response
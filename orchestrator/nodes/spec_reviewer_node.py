@@ -3,11 +3,10 @@ Specification Reviewer Node - validates specifications for completeness and comp
 """
 
 import os
-import time
 import json
-from typing import Optional, Any, Dict
+from typing import Optional, Dict
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
 from orchestrator.state import (
     SharedState, 
     add_open_question, 
@@ -27,8 +26,13 @@ from orchestrator.tools.spec_feature_tools import (
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -36,26 +40,18 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
+_MODEL: Optional[genai.GenerativeModel] = None
+
+def _get_model() -> genai.GenerativeModel:
+    """Returns the shared GenerativeModel, creating it on first use."""
+    global _MODEL
+    if _MODEL is None:
+        _ensure_api_configured()
+        _MODEL = genai.GenerativeModel(model_name=MODEL_NAME)
+    return _MODEL
 
 def spec_reviewer_node(state: SharedState) -> SharedState:
     """
@@ -174,12 +170,9 @@ If status is "approved", proceed to implementation.
 If status is "needs_revision", provide specific issues and questions that need to be addressed.
 """
     
-    # Create model and chat
-    model = genai.GenerativeModel(model_name=MODEL_NAME)
-    chat = model.start_chat()
-    
     try:
-        response = _call_api_with_retry(chat, prompt)
+        # One-shot prompt: no chat session needed
+        response = call_with_retry(_get_model().generate_content, prompt)
         response_text = response.text
         
         # Extract JSON from response
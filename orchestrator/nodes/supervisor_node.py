@@ -1,7 +1,6 @@
 import json
 import os
-import time
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any
 from orchestrator.state import (
     SharedState, 
     Task, 
@@ -17,14 +16,20 @@ from orchestrator.tools.spec_feature_tools import (
     read_all_constitution_files,
 )
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
+from orchestrator.utils.messages import get_last_user_message
 
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 MAX_RECURSION_DEPTH = int(os.getenv("MAX_RECURSION_DEPTH", "100"))
 
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -32,6 +37,7 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
 # Configure on module load
@@ -107,37 +113,6 @@ Instructions:
 If the plan is already complete/empty or no changes needed, return {"tasks": []}.
 """
 
-def _get_last_user_message(messages: List[Any]) -> str:
-    """Return the most recent user message content."""
-    for msg in reversed(messages or []):
-        if hasattr(msg, "type") and getattr(msg, "type") == "human":
-            return str(getattr(msg, "content", ""))
-        if isinstance(msg, dict) and msg.get("role") == "user":
-            return str(msg.get("content", ""))
-    if messages:
-        last = messages[-1]
-        return str(getattr(last, "content", last))
-    return ""
-
-def _call_api_with_retry(model, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = model.generate_content(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
-
 def supervisor_node(state: SharedState) -> SharedState:
     """
     The Supervisor Node responsible for planning and decomposition.
@@ -200,7 +175,7 @@ def supervisor_node(state: SharedState) -> SharedState:
                 return {"phase": "EXECUTING"}  # Will transition to VALIDATING via router
             return {}
     
-    user_msg = _get_last_user_message(state.get('messages', []))
+    user_msg = get_last_user_message(state.get('messages', []))
     if not user_msg:
         return handle_error_with_retry_budget(
             state,
@@ -288,7 +263,7 @@ INSTRUCTIONS: Use tasks.md as the primary source for creating tasks. Convert tas
     )
     
     try:
-        response = _call_api_with_retry(model, prompt)
+        response = call_with_retry(model.generate_content, prompt)
         
         # Extract JSON
         text = response.text
@@ -7,7 +7,7 @@ from orchestrator.state import (
     update_evidence_status,
     handle_error_with_retry_budget,
 )
-from orchestrator.tools.shell_tools import run_shell_command
+from orchestrator.tools.shell_tools import run_shell_command_logged
 from orchestrator.tools.fs_tools import WORKSPACE_DIR
 from orchestrator.nodes.worker_node import get_current_task_id
 from orchestrator.tools.project_profile_tools import (
@@ -28,6 +28,32 @@ SYNTAX_ERROR_PATTERNS = [
     r"IndentationError",
 ]
 
+# Deployment output indicators (case-insensitive substrings), each list
+# compiled into one alternation so the output is scanned once, not lowercased
+DEPLOY_ERROR_INDICATORS = [
+    'deployment failed',
+    'deploy failed',
+    'error deploying',
+    'Error:',
+    'missing credentials',
+    'authentication failed',
+    'permission denied',
+]
+
+DEPLOY_SUCCESS_INDICATORS = [
+    'deployed successfully',
+    'deployment successful',
+    'deployment_url',
+    'preview_url',
+    'vercel.app',
+    'supabase.co',
+    'success": true',
+    '"success": true',
+]
+
+DEPLOY_ERROR_RE = re.compile("|".join(map(re.escape, DEPLOY_ERROR_INDICATORS)), re.IGNORECASE)
+DEPLOY_SUCCESS_RE = re.compile("|".join(map(re.escape, DEPLOY_SUCCESS_INDICATORS)), re.IGNORECASE)
+
 # Patterns to extract deployment URLs from worker output
 VERCEL_URL_PATTERNS = [
     r'https://[a-zA-Z0-9-]+\.vercel\.app',
@@ -106,10 +132,11 @@ def _validate_js_build() -> Tuple[bool, str]:
         return True, ""  # No package.json, skip npm validation
     
     # Try to run syntax check
-    result = run_shell_command("npx eslint . --ext .js,.jsx,.ts,.tsx")
+    result = run_shell_command_logged("npx eslint . --ext .js,.jsx,.ts,.tsx", tail_chars=500)
     
-    if "error" in result.lower() and "command not found" not in result.lower():
-        return False, f"ESLint errors: {result[:500]}"
+    # -1 / 127: eslint could not be started (missing, blocked, timed out) - don't fail on that
+    if result["return_code"] not in (0, -1, 127):
+        return False, f"ESLint errors: {result['output'][-500:]}"
     
     return True, ""
 
@@ -199,32 +226,9 @@ def _validate_deployment(state: SharedState, task: Dict) -> Tuple[bool, List[str
         else:
             output_text += str(msg) + "\n"
     
-    # Check for deployment errors in output
-    error_indicators = [
-        'deployment failed',
-        'deploy failed',
-        'error deploying',
-        'Error:',
-        'missing credentials',
-        'authentication failed',
-        'permission denied',
-    ]
-    
-    has_errors = any(indicator.lower() in output_text.lower() for indicator in error_indicators)
-    
-    # Check for success indicators
-    success_indicators = [
-        'deployed successfully',
-        'deployment successful',
-        'deployment_url',
-        'preview_url',
-        'vercel.app',
-        'supabase.co',
-        'success": true',
-        '"success": true',
-    ]
-    
-    has_success = any(indicator.lower() in output_text.lower() for indicator in success_indicators)
+    # Check for deployment errors / success indicators in output
+    has_errors = DEPLOY_ERROR_RE.search(output_text) is not None
+    has_success = DEPLOY_SUCCESS_RE.search(output_text) is not None
     
     # Extract URLs from output
     extracted_urls = _extract_deployment_urls(recent_messages, task_description)
@@ -320,11 +324,13 @@ def validator_node(state: SharedState, role: str) -> SharedState:
                 first_build_cmd = build_commands[0]
                 try:
                     append_validation_log(f"Running quick build check: {first_build_cmd}", log_type="validation")
-                    build_result = run_shell_command(first_build_cmd, timeout=120)
-                    save_command_log(first_build_cmd, build_result, log_type="build_quick")
+                    # Only the exit code matters here; the output stays in the log
+                    build_result = run_shell_command_logged(
+                        first_build_cmd, timeout=120, log_type="build_quick", tail_chars=0
+                    )
                     
                     # Check if build failed
-                    if "[EXIT CODE]" in build_result and "0" not in build_result:
+                    if build_result["return_code"] != 0:
                         error_messages.append(f"Quick build check failed: {first_build_cmd}")
                         validation_passed = False
                 except Exception as e:
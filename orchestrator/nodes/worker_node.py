@@ -1,9 +1,8 @@
 import os
-import time
 import hashlib
-from typing import Optional, Any, Dict
+from typing import Optional, Dict
 import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
+from orchestrator.utils.retry import call_with_retry
 from orchestrator.state import (
     SharedState, 
     Task, 
@@ -27,8 +26,13 @@ from orchestrator.tools.deploy_tools import (
 # Configuration
 MODEL_NAME = "gemini-2.5-flash-lite"
 
+_API_CONFIGURED = False
+
 def _ensure_api_configured() -> bool:
-    """Ensures API is configured. Returns True if successful."""
+    """Ensures API is configured (once per process). Returns True if successful."""
+    global _API_CONFIGURED
+    if _API_CONFIGURED:
+        return True
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -36,27 +40,9 @@ def _ensure_api_configured() -> bool:
             "Please set it in your .env file or environment."
         )
     genai.configure(api_key=api_key)
+    _API_CONFIGURED = True
     return True
 
-def _call_api_with_retry(chat, prompt: str, max_retries: int = 3) -> Optional[Any]:
-    """Calls API with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = chat.send_message(prompt)
-            return response
-        except google_exceptions.ResourceExhausted as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except google_exceptions.ServiceUnavailable as e:
-            wait_time = 2 ** attempt
-            print(f"Service unavailable. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait_time)
-        except Exception as e:
-            print(f"API Error: {e}")
-            raise
-    raise Exception(f"API call failed after {max_retries} retries")
-
 def _get_file_hash(filepath: str) -> str:
     """Returns MD5 hash of file content."""
     try:
@@ -286,7 +272,7 @@ def worker_node(state: SharedState, role: str) -> SharedState:
     chat = model.start_chat(enable_automatic_function_calling=True)
     
     try:
-        response = _call_api_with_retry(chat, prompt)
+        response = call_with_retry(chat.send_message, prompt)
         result_text = response.text
         
         # Update files snapshot after work is done
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypedDict, List, Dict, Optional, Any, Annotated, Literal
+from typing import TypedDict, List, Dict, Optional, Any, Annotated, Literal, FrozenSet, Tuple, get_args
 from langgraph.graph.message import add_messages
 import operator
 import uuid
@@ -100,7 +100,7 @@ def merge_retry_budget(
     
     # Start with current values
     result = {}
-    for stage in ["spec", "code", "validation"]:
+    for stage in RETRY_STAGES:
         result[stage] = current.get(stage, {"current": 0, "max": 3}).copy()
     
     # Apply updates (updates override current values)
@@ -157,32 +157,41 @@ Phase = Literal[
     "NEEDS_USER_DECISION"
 ]
 
+# All phases, in lifecycle order
+ALL_PHASES: Tuple[str, ...] = get_args(Phase)
+
+# Phases that may transition to / enter anything (recovery)
+RECOVERY_PHASES: FrozenSet[str] = frozenset({"FAILED", "NEEDS_USER_DECISION"})
+
+# Stages tracked by the retry budget
+RETRY_STAGES: Tuple[str, ...] = ("spec", "code", "validation")
+
 # Transition graph: from_phase -> list of allowed to_phases
-PHASE_TRANSITIONS: Dict[str, List[str]] = {
-    "INTAKE": ["SPEC_DRAFT"],
-    "SPEC_DRAFT": ["SPEC_REVIEW", "QUESTIONS_PENDING"],
-    "SPEC_REVIEW": ["SPEC_APPROVED", "QUESTIONS_PENDING", "SPEC_DRAFT"],
-    "QUESTIONS_PENDING": ["SPEC_DRAFT", "NEEDS_USER_DECISION"],
-    "SPEC_APPROVED": ["EXEC_PLANNED"],
-    "EXEC_PLANNED": ["EXECUTING"],
-    "EXECUTING": ["IMPL_REVIEW"],
-    "IMPL_REVIEW": ["VALIDATING", "EXECUTING"],
-    "VALIDATING": ["TRACE_VALIDATION", "EXECUTING"],
-    "TRACE_VALIDATION": ["DONE", "EXECUTING"],
-    "FAILED": [],  # Can transition from any phase, but can't transition to specific phases programmatically
-    "NEEDS_USER_DECISION": [],  # Can transition from any phase, but can't transition to specific phases programmatically
-    "DONE": []  # Terminal state
+PHASE_TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    "INTAKE": ("SPEC_DRAFT",),
+    "SPEC_DRAFT": ("SPEC_REVIEW", "QUESTIONS_PENDING"),
+    "SPEC_REVIEW": ("SPEC_APPROVED", "QUESTIONS_PENDING", "SPEC_DRAFT"),
+    "QUESTIONS_PENDING": ("SPEC_DRAFT", "NEEDS_USER_DECISION"),
+    "SPEC_APPROVED": ("EXEC_PLANNED",),
+    "EXEC_PLANNED": ("EXECUTING",),
+    "EXECUTING": ("IMPL_REVIEW",),
+    "IMPL_REVIEW": ("VALIDATING", "EXECUTING"),
+    "VALIDATING": ("TRACE_VALIDATION", "EXECUTING"),
+    "TRACE_VALIDATION": ("DONE", "EXECUTING"),
+    "FAILED": (),  # Can transition from any phase, but can't transition to specific phases programmatically
+    "NEEDS_USER_DECISION": (),  # Can transition from any phase, but can't transition to specific phases programmatically
+    "DONE": ()  # Terminal state
 }
 
 # Node to phase mapping: which phases allow entering specific nodes
-NODE_PHASES: Dict[str, List[str]] = {
-    "spec_planner": ["INTAKE", "QUESTIONS_PENDING", "EXEC_PLANNED"],  # EXEC_PLANNED for RUN_TASKS intent
-    "spec_reviewer": ["SPEC_DRAFT"],
-    "supervisor": ["SPEC_APPROVED", "EXEC_PLANNED", "EXECUTING", "IMPL_REVIEW"],
-    "dispatcher": ["EXEC_PLANNED", "EXECUTING", "IMPL_REVIEW"],
-    "impl_review": ["EXECUTING", "IMPL_REVIEW"],  # Can enter from EXECUTING phase
-    "validator": ["VALIDATING", "IMPL_REVIEW"],  # Can enter from VALIDATING phase (after impl_review)
-    "final_validator": ["EXECUTING", "VALIDATING"]
+NODE_PHASES: Dict[str, FrozenSet[str]] = {
+    "spec_planner": frozenset({"INTAKE", "QUESTIONS_PENDING", "EXEC_PLANNED"}),  # EXEC_PLANNED for RUN_TASKS intent
+    "spec_reviewer": frozenset({"SPEC_DRAFT"}),
+    "supervisor": frozenset({"SPEC_APPROVED", "EXEC_PLANNED", "EXECUTING", "IMPL_REVIEW"}),
+    "dispatcher": frozenset({"EXEC_PLANNED", "EXECUTING", "IMPL_REVIEW"}),
+    "impl_review": frozenset({"EXECUTING", "IMPL_REVIEW"}),  # Can enter from EXECUTING phase
+    "validator": frozenset({"VALIDATING", "IMPL_REVIEW"}),  # Can enter from VALIDATING phase (after impl_review)
+    "final_validator": frozenset({"EXECUTING", "VALIDATING"})
 }
 
 # Phase to stage mapping: which stage each phase belongs to
@@ -220,7 +229,7 @@ def is_valid_transition(from_phase: str, to_phase: str) -> bool:
     allowed_transitions = PHASE_TRANSITIONS[from_phase]
     
     # FAILED and NEEDS_USER_DECISION can transition to any phase (recovery)
-    if from_phase in ["FAILED", "NEEDS_USER_DECISION"]:
+    if from_phase in RECOVERY_PHASES:
         return True
     
     # DONE is terminal
@@ -246,16 +255,10 @@ def get_allowed_next_phases(current_phase: str) -> List[str]:
     allowed = PHASE_TRANSITIONS[current_phase]
     
     # FAILED and NEEDS_USER_DECISION can transition to any phase
-    if current_phase in ["FAILED", "NEEDS_USER_DECISION"]:
-        # Return all phases except DONE (unless explicitly requested)
-        all_phases = [
-            "INTAKE", "SPEC_DRAFT", "SPEC_REVIEW", "QUESTIONS_PENDING",
-            "SPEC_APPROVED", "EXEC_PLANNED", "EXECUTING", "IMPL_REVIEW",
-            "VALIDATING", "TRACE_VALIDATION", "DONE", "FAILED", "NEEDS_USER_DECISION"
-        ]
-        return all_phases
+    if current_phase in RECOVERY_PHASES:
+        return list(ALL_PHASES)
     
-    return allowed
+    return list(allowed)
 
 
 def can_enter_node(node_name: str, current_phase: str) -> bool:
@@ -276,7 +279,7 @@ def can_enter_node(node_name: str, current_phase: str) -> bool:
     allowed_phases = NODE_PHASES[node_name]
     
     # FAILED and NEEDS_USER_DECISION can enter any node (recovery)
-    if current_phase in ["FAILED", "NEEDS_USER_DECISION"]:
+    if current_phase in RECOVERY_PHASES:
         return True
     
     return current_phase in allowed_phases
@@ -455,7 +458,7 @@ def increment_retry_count(stage: str, retry_budget: Dict[str, Dict[str, int]]) -
         Updated retry budget dictionary
     """
     result = {}
-    for s in ["spec", "code", "validation"]:
+    for s in RETRY_STAGES:
         result[s] = retry_budget.get(s, {"current": 0, "max": 3}).copy()
     
     if stage in result:
@@ -1,7 +1,7 @@
 """Tools available to agent workers."""
 
-from orchestrator.tools.fs_tools import read_file, write_file, list_files, WORKSPACE_DIR
-from orchestrator.tools.shell_tools import run_shell_command, is_command_safe, is_deploy_command
+from orchestrator.tools.fs_tools import read_file, write_file, list_files, list_files_limit, WORKSPACE_DIR
+from orchestrator.tools.shell_tools import run_shell_command, execute_shell_command, run_shell_command_async, run_shell_command_logged, is_command_safe, is_deploy_command
 from orchestrator.tools.deploy_tools import (
     deploy_supabase_migration,
     deploy_supabase_function,
@@ -19,8 +19,10 @@ from orchestrator.tools.project_profile_tools import (
 from orchestrator.tools.validation_artifacts import (
     ensure_artifacts_dir,
     save_command_log,
+    open_command_log,
     save_validation_summary,
     append_validation_log,
+    append_validation_logs,
     get_validation_summary
 )
 
@@ -29,10 +31,14 @@ __all__ = [
     'read_file',
     'write_file', 
     'list_files',
+    'list_files_limit',
     'WORKSPACE_DIR',
     
     # Shell tools
     'run_shell_command',
+    'execute_shell_command',
+    'run_shell_command_async',
+    'run_shell_command_logged',
     'is_command_safe',
     'is_deploy_command',
     
@@ -53,7 +59,9 @@ __all__ = [
     # Validation artifacts tools
     'ensure_artifacts_dir',
     'save_command_log',
+    'open_command_log',
     'save_validation_summary',
     'append_validation_log',
+    'append_validation_logs',
     'get_validation_summary'
 ]
@@ -0,0 +1,64 @@
+"""
+Memoized reads of spec files that rarely change between node runs.
+
+Constitution files and templates are read by several nodes for every feature;
+these wrappers return the previous content until a file's mtime or size
+changes (or a constitution file is added or removed).
+"""
+
+import os
+import functools
+from typing import Optional, Tuple
+from orchestrator.tools.spec_feature_tools import (
+    get_spec_path,
+    read_all_constitution_files,
+    read_template_file,
+)
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path) -> FileStamp:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def constitution_stamp(spec_path: Optional[str] = None) -> Tuple[Tuple[str, int, int], ...]:
+    """(name, mtime_ns, size) of every constitution file, from a single directory scan."""
+    constitution_dir = get_spec_path(spec_path) / "constitution"
+    try:
+        with os.scandir(constitution_dir) as entries:
+            stamp = []
+            for entry in entries:
+                # Same files as the glob("*.md") in read_all_constitution_files
+                if entry.name.endswith(".md") and not entry.name.startswith("."):
+                    st = entry.stat()
+                    stamp.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return ()
+    return tuple(sorted(stamp))
+
+
+@functools.lru_cache(maxsize=32)
+def _constitution_for(spec_path: Optional[str], stamp: Tuple[Tuple[str, int, int], ...]) -> str:
+    return read_all_constitution_files(spec_path)
+
+
+@functools.lru_cache(maxsize=32)
+def _template_for(template_name: str, spec_path: Optional[str], stamp: FileStamp) -> str:
+    return read_template_file(template_name, spec_path)
+
+
+def cached_constitution(spec_path: Optional[str] = None) -> str:
+    """read_all_constitution_files, memoized until a constitution file changes."""
+    return _constitution_for(spec_path, constitution_stamp(spec_path))
+
+
+def cached_template(template_name: str, spec_path: Optional[str] = None) -> str:
+    """read_template_file, memoized until the template changes (a missing template raises, uncached)."""
+    template_file = get_spec_path(spec_path) / "core" / template_name
+    return _template_for(template_name, spec_path, file_stamp(template_file))
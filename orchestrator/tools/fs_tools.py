@@ -1,5 +1,6 @@
 import os
-from typing import Optional, List
+import itertools
+from typing import Iterable, Optional, List
 
 # Security: Restrict file operations to the current working directory sub-folder "workspace"
 # to prevent agents from messing with the orchestrator itself or system files.
@@ -78,3 +79,33 @@ def list_files(directory: str = ".") -> str:
     except Exception as e:
         print(e)
         return f"Error listing files: {str(e)}"
+
+def _walk_pruned(path: str, exclude_dirs: Iterable[str]):
+    """os.walk that never descends into directories named in exclude_dirs."""
+    excluded = frozenset(exclude_dirs)
+    for root, dirnames, filenames in os.walk(path):
+        if excluded:
+            dirnames[:] = [d for d in dirnames if d not in excluded]
+        yield root, filenames
+
+def list_files_limit(
+    directory: str = ".",
+    limit: int = 50,
+    exclude_dirs: Iterable[str] = (),
+    extensions: Iterable[str] = ()
+) -> List[str]:
+    """
+    Lists up to `limit` files in a directory, as workspace-relative paths.
+    Unlike list_files, the walk stops as soon as enough files are found.
+    Directories named in exclude_dirs (e.g. node_modules) are not entered.
+    If extensions (e.g. {".py", ".ts"}) is given, only those files are listed.
+    """
+    path = get_safe_path(directory)
+    wanted = frozenset(extensions)
+    paths = (
+        os.path.relpath(os.path.join(root, filename), WORKSPACE_DIR)
+        for root, filenames in _walk_pruned(path, exclude_dirs)
+        for filename in filenames
+        if not wanted or os.path.splitext(filename)[1] in wanted
+    )
+    return list(itertools.islice(paths, limit))
@@ -77,7 +77,8 @@ def _validate_profile(profile: Dict[str, Any]) -> Optional[ProjectProfile]:
         'test_commands': [],
         'run_commands': [],
         'healthcheck': None,
-        'smoke_checks': []
+        'smoke_checks': [],
+        'parallel_commands': False
     }
     
     # Build commands
@@ -129,6 +130,10 @@ def _validate_profile(profile: Dict[str, Any]) -> Optional[ProjectProfile]:
         elif isinstance(smoke, str):
             normalized['smoke_checks'] = [smoke]
     
+    # Build/test commands are ordered steps by default; the profile can opt in
+    # to running each list concurrently when its commands are independent
+    normalized['parallel_commands'] = profile.get('parallel_commands') is True
+    
     return normalized
 
 def has_project_profile(project_root: Optional[str] = None) -> bool:
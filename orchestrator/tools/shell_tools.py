@@ -1,10 +1,12 @@
 import subprocess
+import asyncio
 import os
 import re
 import shlex
-from typing import Tuple, Optional, List
+import codecs
+from typing import Tuple, Optional, List, Dict, Any
 from orchestrator.tools.fs_tools import WORKSPACE_DIR, ensure_workspace
-from orchestrator.tools.validation_artifacts import save_command_log
+from orchestrator.tools.validation_artifacts import save_command_log, open_command_log
 
 # Whitelist of allowed commands for deployment operations
 ALLOWED_DEPLOY_COMMANDS = [
@@ -258,62 +260,48 @@ def is_deploy_command(command: str) -> bool:
     return False
 
 
-def run_shell_command(command: str, timeout: int = 120, require_confirmation: bool = False) -> str:
+def _prepare_command(command: str, timeout: int, require_confirmation: bool = False) -> Tuple[Optional[List[str]], int, Optional[str]]:
     """
-    Executes a shell command in the workspace directory with security checks.
+    Runs all security checks for a command and parses it into arguments.
     
     Args:
-        command: The shell command to execute
-        timeout: Timeout in seconds (default 120, extended to 300 for deploy commands)
-        require_confirmation: If True, blocks execution (placeholder for future interactive mode)
+        command: The shell command to validate
+        timeout: Requested timeout in seconds
+        require_confirmation: If True, blocks production deploy commands
         
     Returns:
-        Command output or error message
+        Tuple of (args, effective_timeout, error_message). args is None when blocked.
     """
-    ensure_workspace()
-    
     # 1. Check for \n/\r in command string
     is_valid, error_msg = _validate_no_newlines(command)
     if not is_valid:
-        error_msg = f"Error: {error_msg}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, f"Error: {error_msg}"
     
     # 2. Parse command string into list of arguments
     try:
         args = shlex.split(command)
     except ValueError as e:
-        error_msg = f"Error: Command blocked: invalid shell syntax - {str(e)}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, f"Error: Command blocked: invalid shell syntax - {str(e)}"
     
     if not args:
-        error_msg = "Error: Empty command"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, "Error: Empty command"
     
     # 3. Check for \n/\r in each argument
     is_valid, error_msg = _validate_no_newlines_in_args(args)
     if not is_valid:
-        error_msg = f"Error: {error_msg}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, f"Error: {error_msg}"
     
     # 4. Check command allowlist (args[0] is the command name)
     command_name = args[0]
     is_deploy = is_deploy_command(command)
     is_allowed, error_msg = _check_command_allowlist(command_name, full_command=command, is_deploy=is_deploy)
     if not is_allowed:
-        error_msg = f"Error: {error_msg}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, f"Error: {error_msg}"
     
     # 5. Check directory allowlist (only WORKSPACE_DIR allowed)
     is_allowed, error_msg = _check_directory_allowlist(WORKSPACE_DIR)
     if not is_allowed:
-        error_msg = f"Error: {error_msg}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+        return None, timeout, f"Error: {error_msg}"
     
     # Check if this is a deploy command and extend timeout
     if is_deploy:
@@ -322,9 +310,46 @@ def run_shell_command(command: str, timeout: int = 120, require_confirmation: bo
     # Production deployment confirmation check
     if require_confirmation:
         if any(prod_flag in command.lower() for prod_flag in ['--prod', '--production']):
-            error_msg = "Error: Production deployment requires explicit confirmation. Use --auto-deploy flag."
-            save_command_log(command, error_msg, exit_code=-1, log_type="command")
-            return error_msg
+            return None, timeout, "Error: Production deployment requires explicit confirmation. Use --auto-deploy flag."
+    
+    return args, timeout, None
+
+
+def _format_output(stdout: str, stderr: str, returncode: int) -> str:
+    """Combine stdout, stderr and a non-zero exit code into one output string."""
+    output = stdout
+    if stderr:
+        output += f"\n[STDERR]\n{stderr}"
+    if returncode != 0:
+        output += f"\n[EXIT CODE] {returncode}"
+    return output
+
+
+def execute_shell_command(
+    command: str,
+    timeout: int = 120,
+    require_confirmation: bool = False,
+    log_type: str = "command"
+) -> Dict[str, Any]:
+    """
+    Executes a shell command in the workspace directory with security checks.
+    
+    Args:
+        command: The shell command to execute
+        timeout: Timeout in seconds (default 120, extended to 300 for deploy commands)
+        require_confirmation: If True, blocks execution (placeholder for future interactive mode)
+        log_type: Type of log file to write (command, build, etc.)
+        
+    Returns:
+        Dict with 'success', 'return_code', 'stdout', 'stderr' and 'output'
+        (combined text as returned by run_shell_command, or the error message)
+    """
+    ensure_workspace()
+    
+    args, timeout, error_msg = _prepare_command(command, timeout, require_confirmation)
+    if error_msg:
+        save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+        return {'success': False, 'return_code': -1, 'stdout': '', 'stderr': '', 'output': error_msg}
     
     try:
         # 6. Execute command with shell=False
@@ -338,23 +363,234 @@ def run_shell_command(command: str, timeout: int = 120, require_confirmation: bo
             env={**os.environ, 'PATH': os.environ.get('PATH', '')}
         )
         
-        output = result.stdout
-        if result.stderr:
-            output += f"\n[STDERR]\n{result.stderr}"
-            
-        if result.returncode != 0:
-            output += f"\n[EXIT CODE] {result.returncode}"
+        output = _format_output(result.stdout, result.stderr, result.returncode)
         
         # 7. Always log the command execution
-        save_command_log(command, output, exit_code=result.returncode, log_type="command")
+        save_command_log(command, output, exit_code=result.returncode, log_type=log_type)
             
-        return output
+        return {
+            'success': result.returncode == 0,
+            'return_code': result.returncode,
+            'stdout': result.stdout,
+            'stderr': result.stderr,
+            'output': output
+        }
         
     except subprocess.TimeoutExpired:
         error_msg = f"Error: Command timed out after {timeout} seconds."
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
     except Exception as e:
         error_msg = f"Error executing command: {str(e)}"
-        save_command_log(command, error_msg, exit_code=-1, log_type="command")
-        return error_msg
+    
+    save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+    return {'success': False, 'return_code': -1, 'stdout': '', 'stderr': '', 'output': error_msg}
+
+
+def run_shell_command(command: str, timeout: int = 120, require_confirmation: bool = False) -> str:
+    """
+    Executes a shell command in the workspace directory with security checks.
+    
+    Args:
+        command: The shell command to execute
+        timeout: Timeout in seconds (default 120, extended to 300 for deploy commands)
+        require_confirmation: If True, blocks execution (placeholder for future interactive mode)
+        
+    Returns:
+        Command output or error message
+    """
+    return execute_shell_command(command, timeout, require_confirmation)['output']
+
+
+def _read_log_tail(log_path: str, start: int, tail_chars: int) -> str:
+    """Read the last tail_chars of a command log, ignoring everything before byte offset start."""
+    with open(log_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        # Up to 4 bytes per UTF-8 character
+        offset = max(start, f.tell() - tail_chars * 4)
+        f.seek(offset)
+        data = f.read()
+    if offset > start:
+        # The seek may land inside a character: skip its continuation bytes
+        skip = 0
+        while skip < min(3, len(data)) and 0x80 <= data[skip] <= 0xBF:
+            skip += 1
+        data = data[skip:]
+    return data.decode('utf-8', errors='replace')[-tail_chars:]
+
+
+def run_shell_command_logged(
+    command: str,
+    timeout: int = 120,
+    require_confirmation: bool = False,
+    log_type: str = "command",
+    tail_chars: int = 4096
+) -> Dict[str, Any]:
+    """
+    Blocking counterpart of run_shell_command_async.
+    
+    Runs the same security checks, but the child writes its combined
+    stdout/stderr straight into the command log; only the last tail_chars
+    are read back, so large outputs are never held in memory.
+    
+    Args:
+        command: The shell command to execute
+        timeout: Timeout in seconds (default 120, extended to 300 for deploy commands)
+        require_confirmation: If True, blocks production deploy commands
+        log_type: Type of log file to write (build, test, etc.)
+        tail_chars: How much of the end of the output to return
+        
+    Returns:
+        Dict with 'success', 'output' (output tail or error message),
+        'return_code' and 'log_path'
+    """
+    ensure_workspace()
+    
+    args, timeout, error_msg = _prepare_command(command, timeout, require_confirmation)
+    if error_msg:
+        log_path = save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+        return {'success': False, 'output': error_msg, 'return_code': -1, 'log_path': log_path}
+    
+    log_path = None
+    try:
+        log_path, log_file = open_command_log(command, log_type=log_type)
+        with log_file:
+            log_file.flush()
+            start = log_file.tell()
+            proc = subprocess.Popen(
+                args,
+                cwd=WORKSPACE_DIR,
+                shell=False,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, 'PATH': os.environ.get('PATH', '')}
+            )
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                error_msg = f"Error: Command timed out after {timeout} seconds."
+                log_file.seek(0, os.SEEK_END)
+                log_file.write(f"\n{error_msg}\n")
+                log_file.flush()
+                tail = _read_log_tail(log_path, start, tail_chars)
+                return {'success': False, 'output': tail, 'return_code': -1, 'log_path': log_path}
+            
+            tail = _read_log_tail(log_path, start, tail_chars)
+            log_file.seek(0, os.SEEK_END)
+            log_file.write("\n" + "-" * 80 + f"\nExit Code: {proc.returncode}\n")
+        
+        return {
+            'success': proc.returncode == 0,
+            'output': tail,
+            'return_code': proc.returncode,
+            'log_path': log_path
+        }
+        
+    except Exception as e:
+        error_msg = f"Error executing command: {str(e)}"
+        if log_path is None:
+            log_path = save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+        return {'success': False, 'output': error_msg, 'return_code': -1, 'log_path': log_path}
+
+
+async def run_shell_command_async(
+    command: str,
+    timeout: int = 120,
+    require_confirmation: bool = False,
+    log_type: str = "command",
+    tail_chars: int = 4096
+) -> Dict[str, Any]:
+    """
+    Async variant of run_shell_command for validation workloads.
+    
+    Runs the same security checks, but streams the combined stdout/stderr into
+    the command log as it is produced and keeps only the last tail_chars in
+    memory, so chatty builds and test suites don't have to fit in RAM.
+    Several commands can run concurrently (e.g. with asyncio.gather).
+    
+    Args:
+        command: The shell command to execute
+        timeout: Timeout in seconds (default 120, extended to 300 for deploy commands)
+        require_confirmation: If True, blocks production deploy commands
+        log_type: Type of log file to write (build, test, etc.)
+        tail_chars: How much of the end of the output to return
+        
+    Returns:
+        Dict with 'success', 'output' (output tail or error message),
+        'return_code' and 'log_path'
+    """
+    ensure_workspace()
+    
+    args, timeout, error_msg = _prepare_command(command, timeout, require_confirmation)
+    if error_msg:
+        log_path = save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+        return {'success': False, 'output': error_msg, 'return_code': -1, 'log_path': log_path}
+    
+    log_path = None
+    try:
+        log_path, log_file = open_command_log(command, log_type=log_type)
+        with log_file:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=WORKSPACE_DIR,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env={**os.environ, 'PATH': os.environ.get('PATH', '')}
+            )
+            
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            tail = ""
+            
+            async def _pump() -> None:
+                nonlocal tail
+                while True:
+                    chunk = await proc.stdout.read(65536)
+                    if not chunk:
+                        break
+                    text = decoder.decode(chunk)
+                    log_file.write(text)
+                    tail = (tail + text)[-tail_chars:]
+                # Flush a multibyte sequence cut off at EOF
+                text = decoder.decode(b"", final=True)
+                if text:
+                    log_file.write(text)
+                    tail = (tail + text)[-tail_chars:]
+                await proc.wait()
+            
+            try:
+                await asyncio.wait_for(_pump(), timeout=timeout)
+            except asyncio.CancelledError:
+                # Caller gave up on the command; don't leave the process running
+                proc.kill()
+                await proc.wait()
+                log_file.write("\nCancelled\n")
+                raise
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                error_msg = f"Error: Command timed out after {timeout} seconds."
+                log_file.write(f"\n{error_msg}\n")
+                return {'success': False, 'output': f"{tail}\n{error_msg}", 'return_code': -1, 'log_path': log_path}
+            
+            log_file.write("\n" + "-" * 80 + f"\nExit Code: {proc.returncode}\n")
+        
+        return {
+            'success': proc.returncode == 0,
+            'output': tail,
+            'return_code': proc.returncode,
+            'log_path': log_path
+        }
+        
+    except Exception as e:
+        error_msg = f"Error executing command: {str(e)}"
+        if log_path is None:
+            log_path = save_command_log(command, error_msg, exit_code=-1, log_type=log_type)
+        else:
+            # The log was opened (and closed by the with block) before the
+            # failure; record why it has no output
+            try:
+                with open(log_path, 'a', encoding='utf-8') as f:
+                    f.write(f"{error_msg}\n" + "-" * 80 + "\nExit Code: -1\n")
+            except OSError:
+                pass
+        return {'success': False, 'output': error_msg, 'return_code': -1, 'log_path': log_path}
@@ -13,6 +13,20 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_SPEC_PATH = PROJECT_ROOT / "spec"
 
 
+# Map file_type to actual filename
+SPEC_FILE_NAMES = {
+    'spec': 'spec.md',
+    'plan': 'plan.md',
+    'tasks': 'tasks.md',
+    'clarifications': 'clarifications.md',
+    'questions': 'questions.md',
+    'verify-report': 'verify-report.md',
+    'summary': 'summary.md',
+    'validation-report': 'validation_report.md',
+    'risks-debt': 'risks_debt.md',
+}
+
+
 def get_spec_path(spec_path: Optional[str] = None) -> Path:
     """Get absolute path to spec directory."""
     if spec_path:
@@ -192,7 +206,12 @@ def ensure_feature_directory(feature_name: str, spec_path: Optional[str] = None)
         return False
 
 
-def read_spec_file(feature_name: str, file_type: str, spec_path: Optional[str] = None) -> str:
+def read_spec_file(
+    feature_name: str,
+    file_type: str,
+    spec_path: Optional[str] = None,
+    max_chars: Optional[int] = None
+) -> str:
     """
     Read a spec file from spec/features/<feature-name>/.
     
@@ -200,6 +219,7 @@ def read_spec_file(feature_name: str, file_type: str, spec_path: Optional[str] =
         feature_name: Name of the feature
         file_type: Type of file ('spec', 'plan', 'tasks', 'clarifications', 'questions', 'verify-report')
         spec_path: Optional custom path to spec directory
+        max_chars: Read at most this many characters (default: whole file)
         
     Returns:
         Content of the file, or empty string if not found
@@ -207,19 +227,7 @@ def read_spec_file(feature_name: str, file_type: str, spec_path: Optional[str] =
     spec_dir = get_spec_path(spec_path)
     
     # Map file_type to actual filename
-    file_map = {
-        'spec': 'spec.md',
-        'plan': 'plan.md',
-        'tasks': 'tasks.md',
-        'clarifications': 'clarifications.md',
-        'questions': 'questions.md',
-        'verify-report': 'verify-report.md',
-        'summary': 'summary.md',
-        'validation-report': 'validation_report.md',
-        'risks-debt': 'risks_debt.md',
-    }
-    
-    filename = file_map.get(file_type, f"{file_type}.md")
+    filename = SPEC_FILE_NAMES.get(file_type, f"{file_type}.md")
     file_path = spec_dir / "features" / feature_name / filename
     
     if not file_path.exists():
@@ -227,7 +235,7 @@ def read_spec_file(feature_name: str, file_type: str, spec_path: Optional[str] =
     
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+            return f.read(-1 if max_chars is None else max_chars)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return ""
@@ -253,19 +261,7 @@ def write_spec_file(feature_name: str, file_type: str, content: str, spec_path:
         return False
     
     # Map file_type to actual filename
-    file_map = {
-        'spec': 'spec.md',
-        'plan': 'plan.md',
-        'tasks': 'tasks.md',
-        'clarifications': 'clarifications.md',
-        'questions': 'questions.md',
-        'verify-report': 'verify-report.md',
-        'summary': 'summary.md',
-        'validation-report': 'validation_report.md',
-        'risks-debt': 'risks_debt.md',
-    }
-    
-    filename = file_map.get(file_type, f"{file_type}.md")
+    filename = SPEC_FILE_NAMES.get(file_type, f"{file_type}.md")
     file_path = spec_dir / "features" / feature_name / filename
     
     try:
@@ -277,6 +273,45 @@ def write_spec_file(feature_name: str, file_type: str, content: str, spec_path:
         return False
 
 
+def write_spec_file_bytes(feature_name: str, file_type: str, data: bytes, spec_path: Optional[str] = None) -> bool:
+    """
+    Write already-encoded (UTF-8) content to a spec file in one write.
+    
+    Same file mapping as write_spec_file, but skips the buffered text layer;
+    useful when the caller has encoded the content once up front.
+    
+    Args:
+        feature_name: Name of the feature
+        file_type: Type of file ('spec', 'plan', 'tasks', 'clarifications', 'questions', 'verify-report')
+        data: UTF-8 encoded content
+        spec_path: Optional custom path to spec directory
+        
+    Returns:
+        True if successful
+    """
+    spec_dir = get_spec_path(spec_path)
+    
+    # Ensure feature directory exists
+    if not ensure_feature_directory(feature_name, spec_path):
+        return False
+    
+    filename = SPEC_FILE_NAMES.get(file_type, f"{file_type}.md")
+    file_path = spec_dir / "features" / feature_name / filename
+    
+    try:
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return True
+    except Exception as e:
+        print(f"Error writing {file_path}: {e}")
+        return False
+
+
 def list_features(spec_path: Optional[str] = None) -> List[str]:
     """
     List all features in spec/features/.
@@ -5,7 +5,7 @@ Tools for managing validation artifacts and logs.
 import os
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO, Tuple
 from orchestrator.tools.fs_tools import WORKSPACE_DIR
 
 ARTIFACTS_DIR = "artifacts"
@@ -31,6 +31,11 @@ def ensure_artifacts_dir(project_root: Optional[str] = None) -> str:
     
     return validation_path
 
+def _new_log_path(validation_dir: str, log_type: str) -> str:
+    """Unique log file path; microseconds keep concurrent commands from colliding."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(validation_dir, f"{log_type}_{timestamp}.log")
+
 def save_command_log(
     command: str,
     output: str,
@@ -53,9 +58,7 @@ def save_command_log(
     """
     validation_dir = ensure_artifacts_dir(project_root)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"{log_type}_{timestamp}.log"
-    log_path = os.path.join(validation_dir, log_filename)
+    log_path = _new_log_path(validation_dir, log_type)
     
     with open(log_path, 'w', encoding='utf-8') as f:
         f.write(f"Command: {command}\n")
@@ -67,6 +70,35 @@ def save_command_log(
     
     return log_path
 
+def open_command_log(
+    command: str,
+    log_type: str = "command",
+    project_root: Optional[str] = None
+) -> Tuple[str, TextIO]:
+    """
+    Create a command log file and return it open for streaming output into it.
+    
+    The header matches save_command_log; the caller writes output as it
+    arrives and closes the file (the exit code goes at the end).
+    
+    Args:
+        command: Command being executed
+        log_type: Type of log (build, test, healthcheck, etc.)
+        project_root: Path to project root (default: WORKSPACE_DIR)
+        
+    Returns:
+        Tuple of (log_path, open file handle)
+    """
+    validation_dir = ensure_artifacts_dir(project_root)
+    log_path = _new_log_path(validation_dir, log_type)
+    
+    f = open(log_path, 'w', encoding='utf-8')
+    f.write(f"Command: {command}\n")
+    f.write(f"Timestamp: {datetime.now().isoformat()}\n")
+    f.write("-" * 80 + "\n")
+    
+    return log_path, f
+
 def save_validation_summary(
     summary: Dict[str, Any],
     project_root: Optional[str] = None
@@ -116,6 +148,31 @@ def append_validation_log(
     
     return log_path
 
+def append_validation_logs(
+    entries: List[Tuple[datetime, str]],
+    log_type: str = "validation",
+    project_root: Optional[str] = None
+) -> str:
+    """
+    Append several messages to validation log file with a single write.
+    
+    Args:
+        entries: (timestamp, message) pairs, in order
+        log_type: Type of log (default: validation)
+        project_root: Path to project root (default: WORKSPACE_DIR)
+        
+    Returns:
+        Path to log file
+    """
+    validation_dir = ensure_artifacts_dir(project_root)
+    
+    log_path = os.path.join(validation_dir, f"{log_type}.log")
+    
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write("".join(f"[{ts.isoformat()}] {message}\n" for ts, message in entries))
+    
+    return log_path
+
 def get_validation_summary(project_root: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Get validation summary from summary.json.
@@ -3,10 +3,30 @@
 from orchestrator.utils.caching import get_cached_content
 from orchestrator.utils.logging import get_logger, ExecutionLogger
 from orchestrator.utils.secrets import SecretManager
+from orchestrator.utils.retry import (
+    backoff_delay,
+    retry_after_seconds,
+    call_with_retry,
+    call_with_retry_async,
+    RECOVERABLE_API_ERRORS
+)
+from orchestrator.utils.json_scan import JsonObjectScanner, extract_first_json
+from orchestrator.utils.messages import get_last_user_message, find_last_user_message, is_user_message, message_text
 
 __all__ = [
     'get_cached_content', 
     'get_logger', 
     'ExecutionLogger',
-    'SecretManager'
+    'SecretManager',
+    'backoff_delay',
+    'retry_after_seconds',
+    'call_with_retry',
+    'call_with_retry_async',
+    'RECOVERABLE_API_ERRORS',
+    'JsonObjectScanner',
+    'extract_first_json',
+    'get_last_user_message',
+    'find_last_user_message',
+    'is_user_message',
+    'message_text'
 ]
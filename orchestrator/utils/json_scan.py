@@ -0,0 +1,55 @@
+"""
+Incremental scanner for the first JSON object in model output.
+"""
+
+from typing import Optional, Tuple
+
+
+class JsonObjectScanner:
+    """
+    Single forward pass that finds the bounds of the first top-level JSON
+    object, honouring string literals and escapes. Text can be fed in chunks,
+    e.g. as a streamed response arrives.
+    """
+    
+    def __init__(self):
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._pos = 0
+    
+    def feed(self, text: str) -> Optional[int]:
+        """Scan more text; returns the end offset (exclusive) once the object closes."""
+        if self.end is not None:
+            return self.end
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == "{":
+                if self.start is None:
+                    self.start = self._pos
+                self._depth += 1
+            elif self.start is not None and ch == '"':
+                self._in_string = True
+            elif self.start is not None and ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._pos + 1
+                    return self.end
+            self._pos += 1
+        return None
+
+
+def extract_first_json(text: str) -> Optional[Tuple[int, int]]:
+    """(start, end) of the first balanced JSON object in text, or None."""
+    scanner = JsonObjectScanner()
+    if scanner.feed(text) is None:
+        return None
+    return scanner.start, scanner.end
@@ -0,0 +1,40 @@
+"""
+Helpers for reading user input out of the shared message history.
+"""
+
+from typing import Any, List, Optional
+
+
+def is_user_message(msg: Any) -> bool:
+    """True for a user message (LangChain human message or role dict)."""
+    if isinstance(msg, dict):
+        return msg.get("role") == "user"
+    # One getattr with a default: no AttributeError path as with hasattr
+    return getattr(msg, "type", None) == "human"
+
+
+def message_text(msg: Any) -> str:
+    """Text content of a message (LangChain message, role dict or plain value)."""
+    if isinstance(msg, dict):
+        return str(msg.get("content", ""))
+    return str(getattr(msg, "content", msg))
+
+
+def find_last_user_message(messages: Optional[List[Any]]) -> Optional[Any]:
+    """Most recent user message, scanning the history backwards; None if there is none."""
+    return next((msg for msg in reversed(messages or []) if is_user_message(msg)), None)
+
+
+def get_last_user_message(messages: Optional[List[Any]]) -> str:
+    """
+    Return the most recent user message content.
+    
+    Falls back to the last message of any kind when no user message is found,
+    and to an empty string for an empty history.
+    """
+    msg = find_last_user_message(messages)
+    if msg is None:
+        if not messages:
+            return ""
+        msg = messages[-1]
+    return message_text(msg)
@@ -0,0 +1,163 @@
+"""
+Retry helpers shared by nodes that call the Gemini API.
+"""
+
+import time
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from google.api_core import exceptions as google_exceptions
+
+# Backoff defaults: 1s, 2s, 4s, ... capped at 30s, plus up to 50% random jitter
+BACKOFF_BASE = 1.0
+BACKOFF_MAX_DELAY = 30.0
+BACKOFF_JITTER = 0.5
+
+# Transient API errors worth retrying; anything else (bad request, auth,
+# permission) fails the same way on every attempt and is raised at once
+RECOVERABLE_API_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = BACKOFF_BASE,
+    max_delay: float = BACKOFF_MAX_DELAY,
+    jitter: float = BACKOFF_JITTER
+) -> float:
+    """
+    Exponential backoff delay with random jitter.
+    
+    The jitter spreads out retries from parallel nodes that were rate-limited
+    at the same moment, so they don't all hit the API again in lockstep.
+    
+    Args:
+        attempt: Zero-based attempt number
+        base: Delay for the first retry in seconds
+        max_delay: Upper bound for the exponential part in seconds
+        jitter: Maximum extra fraction of the delay added at random
+        
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return min(max_delay, base * (2 ** attempt)) * (1 + random.uniform(0, jitter))
+
+
+def retry_after_seconds(error: Any) -> Optional[float]:
+    """
+    Server-suggested retry delay carried by an API error, if any.
+    
+    Looks for a google.rpc.RetryInfo entry in the error details (what Gemini
+    attaches to ResourceExhausted) and then for an HTTP Retry-After header.
+    
+    Args:
+        error: Exception raised by the API client
+        
+    Returns:
+        Delay in seconds, or None if the server did not suggest one
+    """
+    for detail in getattr(error, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            return retry_delay.seconds + retry_delay.nanos / 1e9
+    
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+    
+    return None
+
+
+def _retry_wait(error: Exception, attempt: int) -> Tuple[float, str]:
+    """Seconds to wait after a recoverable error, and a short reason for the log line."""
+    if isinstance(error, google_exceptions.ResourceExhausted):
+        # The server's suggested delay is a floor for our own backoff
+        return max(retry_after_seconds(error) or 0.0, backoff_delay(attempt)), "Rate limit hit"
+    return backoff_delay(attempt), f"Transient API error ({type(error).__name__})"
+
+
+def call_with_retry(
+    fn: Callable[..., Any],
+    *args: Any,
+    max_retries: int = 3,
+    log: Callable[[str], Any] = print,
+    **kwargs: Any
+) -> Any:
+    """
+    Call an API function, retrying recoverable errors with exponential backoff.
+    
+    Unrecoverable errors (bad request, auth, permission) fail the same way on
+    every attempt, so they are raised at once. No wait follows the last attempt.
+    
+    Args:
+        fn: API call, e.g. model.generate_content or chat.send_message
+        *args: Positional arguments for fn
+        max_retries: Total number of attempts
+        log: Sink for retry and error messages
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        Whatever fn returns
+        
+    Raises:
+        Exception: If every attempt failed with a recoverable error
+    """
+    for attempt in range(max_retries):
+        try:
+            return fn(*args, **kwargs)
+        except RECOVERABLE_API_ERRORS as e:
+            if attempt + 1 == max_retries:
+                break
+            wait_time, reason = _retry_wait(e, attempt)
+            log(f"{reason}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait_time)
+        except Exception as e:
+            log(f"API Error: {e}")
+            raise
+    raise Exception(f"API call failed after {max_retries} retries")
+
+
+async def call_with_retry_async(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    max_retries: int = 3,
+    log: Callable[[str], Any] = print,
+    **kwargs: Any
+) -> Any:
+    """
+    Async twin of call_with_retry: awaits fn, and backoff waits don't block the event loop.
+    
+    Args:
+        fn: Async API call, e.g. model.generate_content_async
+        *args: Positional arguments for fn
+        max_retries: Total number of attempts
+        log: Sink for retry and error messages
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        Whatever fn returns once awaited
+        
+    Raises:
+        Exception: If every attempt failed with a recoverable error
+    """
+    for attempt in range(max_retries):
+        try:
+            return await fn(*args, **kwargs)
+        except RECOVERABLE_API_ERRORS as e:
+            if attempt + 1 == max_retries:
+                break
+            wait_time, reason = _retry_wait(e, attempt)
+            log(f"{reason}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+            await asyncio.sleep(wait_time)
+        except Exception as e:
+            log(f"API Error: {e}")
+            raise
+    raise Exception(f"API call failed after {max_retries} retries")